@@ -48,8 +48,9 @@ class StatementLexer(Lexer):
         self.statement = statement
 
     def lex(self, ctx):
+        token_type = self.token_type
         for token in self.statement:
-            token.type = self.token_type
+            token.type = token_type
 
 
 class BlockLexer(Lexer):
@@ -217,8 +218,9 @@ class VariableLexer(StatementLexer):
     def lex(self, ctx):
         # TODO: Validation?
         self.statement[0].type = Token.VARIABLE
+        argument = Token.ARGUMENT
         for token in self.statement[1:]:
-            token.type = Token.ARGUMENT
+            token.type = argument
 
 
 class TestCaseSectionLexer(SectionLexer):
@@ -318,12 +320,13 @@ class ForLoopLexer(StatementLexer):
         separator_seen = False
         arguments_seen = False
         self.statement[0].type = Token.FOR
+        for_separator, argument = Token.FOR_SEPARATOR, Token.ARGUMENT
         for token in self.statement[1:]:
             if self._is_separator(token.value, arguments_seen, separator_seen):
-                token.type = Token.FOR_SEPARATOR
+                token.type = for_separator
                 separator_seen = True
             else:
-                token.type = Token.ARGUMENT
+                token.type = argument
                 arguments_seen = True
 
     def _is_separator(self, value, arguments_seen, separator_seen):
@@ -351,14 +354,16 @@ class KeywordCallLexer(StatementLexer):
             self._lex_as_keyword_call()
 
     def _lex_as_template(self):
+        argument = Token.ARGUMENT
         for token in self.statement:
-            token.type = Token.ARGUMENT
+            token.type = argument
 
     def _lex_as_keyword_call(self):
         keyword_seen = False
+        argument = Token.ARGUMENT
         for token in self.statement:
             if keyword_seen:
-                token.type = Token.ARGUMENT
+                token.type = argument
             elif self._is_assign(token.value):
                 token.type = Token.ASSIGN
             else:
@@ -48,7 +48,7 @@ class Splitter(object):
                 yield Token(data if is_data else sepa, value, lineno, columnno)
             columnno += len(value)
         if not data_only:
-            trailing_whitespace = re.search(r'\s+$', line, flags=re.UNICODE)
+            trailing_whitespace = self._trailing_whitespace.search(line)
             if trailing_whitespace:
                 yield Token(Token.EOL, trailing_whitespace.group(), lineno, columnno)
 
@@ -79,36 +79,40 @@ class Splitter(object):
     def _handle_comments(self, tokens):
         has_data = False
         commented = False
+        data, comment = Token.DATA, Token.COMMENT
         for token in tokens:
-            if token.type == token.DATA:
+            if token.type == data:
                 if token.value.startswith('#') or commented:
-                    token.type = token.COMMENT
+                    token.type = comment
                     commented = True
                 elif token.value:
                     has_data = True
         return has_data
 
     def _handle_continuation(self, tokens):
+        data, sepa = Token.DATA, Token.SEPARATOR
         for token in tokens:
-            if token.value == '...' and token.type == token.DATA:
-                token.type = token.CONTINUATION
+            if token.value == '...' and token.type == data:
+                token.type = Token.CONTINUATION
                 return True
-            elif token.value and token.type != token.SEPARATOR:
+            elif token.value and token.type != sepa:
                 return False
         return False
 
     def _remove_trailing_empty(self, tokens):
+        data = Token.DATA
         for token in reversed(tokens):
             if not token.value:
                 tokens.remove(token)
-            elif token.type == token.DATA:
+            elif token.type == data:
                 break
 
     def _remove_leading_empty(self, tokens):
+        head_types = (Token.DATA, Token.CONTINUATION)
         for token in list(tokens):
             if not token.value:
                 tokens.remove(token)
-            elif token.type in (token.DATA, token.CONTINUATION):
+            elif token.type in head_types:
                 break
 
     def _ensure_data_after_continuation(self, tokens):
@@ -123,4 +127,6 @@ class Splitter(object):
                 return token
 
     def _remove_non_data(self, tokens):
-        return [t for t in tokens if t.type == t.DATA]
+        data_type = Token.DATA
+        data = [t for t in tokens if t.type == data_type]
+        return data if len(data) < len(tokens) else tokens
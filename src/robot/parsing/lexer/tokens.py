@@ -63,8 +63,10 @@ class Token(object):
 
     NON_DATA_TOKENS = {SEPARATOR, COMMENT, CONTINUATION, IGNORE}
 
-    # TODO: Enable slots when we know what attributes ply needs.
-    #__slots__ = ['type', 'value', 'lineno', 'columnno']
+    # 'lexer', 'lexpos', 'endlexpos' and 'endlineno' are needed because ply's
+    # yacc assigns them to tokens during error recovery and position tracking.
+    __slots__ = ['type', 'value', 'lineno', 'columnno', 'error',
+                 'lexer', 'lexpos', 'endlexpos', 'endlineno']
 
     def __init__(self, type, value='', lineno=-1, columnno=-1):
         self.type = type
@@ -83,10 +85,12 @@ class Token(object):
 
 
 Token.DATA_TOKENS = [t for t in Token.__dict__
-                     if t[0] != '_' and t not in Token.NON_DATA_TOKENS]
+                     if t[0] != '_' and t.isupper()
+                     and t not in Token.NON_DATA_TOKENS]
 
 
 class EOS(Token):
+    __slots__ = []
 
     def __init__(self, lineno=-1, columnno=-1):
         Token.__init__(self, Token.EOS, '', lineno, columnno)
@@ -25,10 +25,9 @@ class _Aligner(object):
         return [self.align_row(r) for r in rows]
 
     def align_row(self, row):
-        for index, col in enumerate(row):
-            if len(self._widths) <= index:
-                break
-            row[index] = row[index].ljust(self._widths[index])
+        for index, (col, width) in enumerate(zip(row, self._widths)):
+            if len(col) < width:
+                row[index] = col.ljust(width)
         return row
 
 
@@ -36,6 +35,12 @@ class FirstColumnAligner(_Aligner):
 
     def __init__(self, first_column_width):
         _Aligner.__init__(self, [first_column_width])
+        self._width = first_column_width
+
+    def align_row(self, row):
+        if row and len(row[0]) < self._width:
+            row[0] = row[0].ljust(self._width)
+        return row
 
 
 class ColumnAligner(_Aligner):
@@ -45,13 +50,15 @@ class ColumnAligner(_Aligner):
 
     def _count_widths(self, first_column_width, table):
         result = [first_column_width] + [len(h) for h in table.header[1:]]
+        count = len(result)
         for row in DataExtractor().rows_from_table(table):
-            for index, col in enumerate(row[1:]):
-                index += 1
-                if len(result) <= index:
-                    result.append(len(col))
-                else:
-                    result[index] = max(len(col), result[index])
+            for index, col in enumerate(row[1:], start=1):
+                width = len(col)
+                if count <= index:
+                    result.append(width)
+                    count += 1
+                elif width > result[index]:
+                    result[index] = width
         return result
 
 
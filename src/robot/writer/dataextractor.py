@@ -16,34 +16,34 @@
 
 class DataExtractor(object):
     """Transforms table of a parsed test data file into a list of rows."""
+    _name_table_types = frozenset(('setting', 'variable'))
 
     def __init__(self, want_name_on_first_row=None):
         self._want_name_on_first_row = want_name_on_first_row or \
                                        (lambda t,n: False)
 
     def rows_from_table(self, table):
-        if table.type in ['setting', 'variable']:
+        if table.type in self._name_table_types:
             return self._rows_from_item(table)
         return self._rows_from_indented_table(table)
 
     def _rows_from_indented_table(self, table):
         items = list(table)
+        last_index = len(items) - 1
         for index, item in enumerate(items):
             for row in self._rows_from_test_or_keyword(item, table):
                 yield row
-            if not self._last(items, index):
+            if index < last_index:
                 yield []
 
     def _rows_from_test_or_keyword(self, test_or_keyword, table):
         rows = list(self._rows_from_item(test_or_keyword, 1))
-        for r in self._add_name(test_or_keyword.name, rows, table):
-            yield r
-
-    def _add_name(self, name, rows, table):
+        name = test_or_keyword.name
         if rows and self._want_name_on_first_row(table, name):
             rows[0][0] = name
-            return rows
-        return [[name]] + rows
+        else:
+            rows.insert(0, [name])
+        return rows
 
     def _rows_from_item(self, item, indent=0):
         for child in item:
@@ -53,6 +53,3 @@ class DataExtractor(object):
                 for row in self._rows_from_item(child, indent+1):
                     yield row
                 yield ['', 'END']
-
-    def _last(self, items, index):
-        return index >= len(items) -1
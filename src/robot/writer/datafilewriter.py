@@ -39,7 +39,8 @@ class DataFileWriter(object):
             :py:class:`~robot.parsing.model.TestDataDirectory`
         """
         with WritingContext(datafile, **self._options) as ctx:
-            FileWriter(ctx).write(datafile)
+            with FileWriter(ctx) as writer:
+                writer.write(datafile)
 
 
 class WritingContext(object):
@@ -47,24 +47,50 @@ class _DataFileWriter(object):
     def __init__(self, formatter, configuration):
         self._formatter = formatter
         self._output = configuration.output
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Flushes pending output without closing the underlying stream."""
+        if self._output is not None:
+            self._write_pending()
+            self._output.flush()
+            self._output = None
 
     def write(self, datafile):
         tables = [table for table in datafile if table]
+        last = tables[-1] if tables else None
         for table in tables:
-            self._write_table(table, is_last=table is tables[-1])
+            self._write_table(table, is_last=table is last)
+        self._write_pending()
+        self._output.flush()
 
     def _write_table(self, table, is_last):
         self._write_header(table)
         self._write_rows(self._formatter.format_table(table))
         if not is_last:
             self._write_empty_row(table)
+        self._write_pending()
+
+    def _write_pending(self):
+        # Text based writers buffer formatted lines to `self._pending` to
+        # avoid writing to the output stream line by line.
+        if self._pending:
+            self._output.write(''.join(self._pending))
+            del self._pending[:]
 
     def _write_header(self, table):
         self._write_row(self._formatter.format_header(table))
 
     def _write_rows(self, rows):
+        write_row = self._write_row
         for row in rows:
-            self._write_row(row)
+            write_row(row)
 
     def _write_empty_row(self, table):
         self._write_row(self._formatter.empty_row_after(table))
@@ -78,11 +104,11 @@ class SpaceSeparatedTxtWriter(_DataFileWriter):
     def __init__(self, configuration):
         formatter = TxtFormatter(configuration.txt_column_count)
         self._separator = ' ' * configuration.txt_separating_spaces
+        self._join_cells = self._separator.join
         _DataFileWriter.__init__(self, formatter, configuration)
 
     def _write_row(self, row):
-        line = self._separator.join(row).rstrip() + '\n'
-        self._output.write(line)
+        self._pending.append(self._join_cells(row).rstrip() + '\n')
 
 
 class PipeSeparatedTxtWriter(_DataFileWriter):
@@ -90,13 +116,12 @@ class PipeSeparatedTxtWriter(_DataFileWriter):
 
     def __init__(self, configuration):
         formatter = PipeFormatter(configuration.txt_column_count)
+        self._join_cells = self._separator.join
         _DataFileWriter.__init__(self, formatter, configuration)
 
     def _write_row(self, row):
-        row = self._separator.join(row)
-        if row:
-            row = '| ' + row + ' |'
-        self._output.write(row + '\n')
+        row = self._join_cells(row)
+        self._pending.append('| %s |\n' % row if row else '\n')
 
 
 class TsvFileWriter(_DataFileWriter):
@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 import re
+from itertools import chain
 
 from .aligners import FirstColumnAligner, ColumnAligner, NullAligner
 from .dataextractor import DataExtractor
@@ -21,8 +22,13 @@ from .rowsplitter import RowSplitter
 
 
 class _DataFileFormatter(object):
-    _whitespace = re.compile('\s{2,}')
+    _whitespace = re.compile(r'\s{2,}', re.UNICODE)
+    # Matches whitespace that the two-space fast path in
+    # _escape_whitespace cannot handle.
+    _non_plain_space = re.compile(r'(?: {3,})|[^\S ]', re.UNICODE)
     _split_multiline_doc = True
+    _indented_table_types = frozenset(('test case', 'keyword'))
+    _name_table_types = frozenset(('setting', 'variable'))
 
     def __init__(self, column_count):
         self._splitter = RowSplitter(column_count, self._split_multiline_doc)
@@ -43,25 +49,36 @@ class _DataFileFormatter(object):
         rows = self._extractor.rows_from_table(table)
         if self._should_split_rows(table):
             rows = self._split_rows(rows, table)
-        return (self._format_row(r, table) for r in rows)
+        format_row = self._format_row
+        return [format_row(r, table) for r in rows]
 
     def _should_split_rows(self, table):
         return not self._should_align_columns(table)
 
     def _split_rows(self, original_rows, table):
-        for original in original_rows:
-            for split in self._splitter.split(original, table.type):
-                yield split
+        split = self._splitter.split
+        table_type = table.type
+        return chain.from_iterable(split(row, table_type)
+                                   for row in original_rows)
 
     def _should_align_columns(self, table):
         return self._is_indented_table(table) and bool(table.header[1:])
 
     def _is_indented_table(self, table):
-        return table is not None and table.type in ['test case', 'keyword']
+        return table is not None and table.type in self._indented_table_types
 
     def _escape_consecutive_whitespace(self, row):
-        return [self._whitespace.sub(self._whitespace_escaper,
-                                     cell.replace('\n', ' ')) for cell in row]
+        escape = self._escape_whitespace
+        return [escape(cell) for cell in row]
+
+    def _escape_whitespace(self, cell):
+        if '\n' in cell:
+            cell = cell.replace('\n', ' ')
+        if '  ' in cell and not self._non_plain_space.search(cell):
+            # Runs of exactly two plain spaces are by far the most common
+            # case and can be escaped without the per-match callback.
+            return cell.replace('  ', ' \\ ')
+        return self._whitespace.sub(self._whitespace_escaper, cell)
 
     def _whitespace_escaper(self, match):
         return '\\'.join(match.group(0))
@@ -92,20 +109,35 @@ class TsvFormatter(_DataFileFormatter):
 
     def _pad(self, row):
         row = [cell.replace('\n', ' ') for cell in row]
-        return row + [''] * (self._column_count - len(row))
+        row += [''] * (self._column_count - len(row))
+        return row
 
 
 class TxtFormatter(_DataFileFormatter):
     _test_or_keyword_name_width = 18
     _setting_and_variable_name_width = 14
 
+    def __init__(self, column_count):
+        _DataFileFormatter.__init__(self, column_count)
+        self._aligner = None
+        self._aligner_table = None
+
     def _format_row(self, row, table=None):
         row = self._escape(row)
         aligner = self._aligner_for(table)
         return aligner.align_row(row)
 
     def _aligner_for(self, table):
-        if table and table.type in ['setting', 'variable']:
+        # Creating a ColumnAligner scans all rows of the table. Reuse the
+        # aligner while the same table is being formatted to avoid scanning
+        # the table again for every row.
+        if self._aligner is None or table is not self._aligner_table:
+            self._aligner = self._create_aligner(table)
+            self._aligner_table = table
+        return self._aligner
+
+    def _create_aligner(self, table):
+        if table and table.type in self._name_table_types:
             return FirstColumnAligner(self._setting_and_variable_name_width)
         if self._should_align_columns(table):
             return ColumnAligner(self._test_or_keyword_name_width, table)
@@ -123,27 +155,34 @@ class TxtFormatter(_DataFileFormatter):
     def _escape(self, row):
         if not row:
             return row
-        return list(self._escape_cells(self._escape_consecutive_whitespace(row)))
-
-    def _escape_cells(self, row):
-        escape = False
+        escape_whitespace = self._escape_whitespace
+        escaped = []
+        data_seen = False
         for cell in row:
             if cell:
-                escape = True
-            elif escape:
+                data_seen = True
+                cell = escape_whitespace(cell)
+            elif data_seen:
                 cell = '\\'
-            yield cell
+            escaped.append(cell)
+        return escaped
 
 
 class PipeFormatter(TxtFormatter):
 
-    def _escape_cells(self, row):
-        return [self._escape_empty(self._escape_pipes(cell)) for cell in row]
-
-    def _escape_empty(self, cell):
-        return cell or '  '
-
-    def _escape_pipes(self, cell):
+    def _escape(self, row):
+        if not row:
+            return row
+        escape_whitespace = self._escape_whitespace
+        escape_cell = self._escape_cell
+        return [escape_cell(escape_whitespace(cell)) if cell else '  '
+                for cell in row]
+
+    def _escape_cell(self, cell):
+        if not cell:
+            return '  '
+        if '|' not in cell:
+            return cell
         if ' | ' in cell:
             cell = cell.replace(' | ', ' \\| ')
         if cell.startswith('| '):
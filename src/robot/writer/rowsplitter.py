@@ -21,7 +21,7 @@ class RowSplitter(object):
     _empty_cell_escape = '${EMPTY}'
     _line_continuation = '...'
     _setting_table = 'setting'
-    _indented_tables = ('test case', 'keyword')
+    _indented_tables = frozenset(('test case', 'keyword'))
     _split_from = ('ELSE', 'ELSE IF', 'AND')
 
     def __init__(self, cols=8, split_multiline_doc=True):
@@ -34,8 +34,16 @@ class RowSplitter(object):
         indent = self._get_indent(row, table_type)
         if self._split_multiline_doc and self._is_doc_row(row, table_type):
             return self._split_doc_row(row, indent)
+        if len(row) <= self._cols and not self._contains_split_marker(row):
+            return self._split_not_needed(row)
         return self._split_row(row, indent)
 
+    def _contains_split_marker(self, row):
+        return any(marker in row for marker in self._split_from)
+
+    def _split_not_needed(self, row):
+        yield self._escape_last_cell_if_empty(row)
+
     def _split_empty_row(self):
         yield []
 
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+
+from robot.utils.asserts import assert_true
+
+from robot.parsing import get_test_case_file_ast
+from robot.parsing.nodes import DataFile
+
+
+class TestErrorRecovery(unittest.TestCase):
+    """Parsing invalid data must recover via yacc's error recovery.
+
+    This is a regression test for Token.__slots__: ply's yacc assigns
+    attributes like 'lexer' and 'lexpos' to tokens when a syntax error is
+    handled, so the slot list must cover them.
+    """
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.robot')
+        with os.fdopen(handle, 'w') as file:
+            file.write('*** Test Cases ***\n'
+                       '    :FOR    ${x}    IN    a\n'
+                       'T2\n'
+                       '    Log    y\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_parsing_invalid_data_returns_datafile(self):
+        ast = get_test_case_file_ast(self.path)
+        assert_true(isinstance(ast, DataFile))
+
+
+if __name__ == '__main__':
+    unittest.main()